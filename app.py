@@ -7,20 +7,26 @@ Designed to be deployable as a webserver for digital signage.
 Run with: uv run streamlit run app.py
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import pandas as pd
 
 from data_loader import (
+    MS_PER_MINUTE,
     load_all_data,
+    filter_year,
     search_tracks,
     search_artists,
     get_artist_plays,
     get_track_stats,
     get_heatmap_data,
     get_top_artists,
-    get_top_tracks,
+    get_top_tracks_combined,
     get_top_albums,
     get_most_skipped,
     get_not_on_playlist_stats,
@@ -60,213 +66,357 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# All Time charts only change when the data reloads and are what a signage
+# display shows by default, so render them without client-side interaction
+STATIC_CHART_CONFIG = {"staticPlot": True}
+
+
+@st.cache_resource(ttl=3600)
+def get_data() -> tuple[pd.DataFrame, int]:
+    """
+    Load data once and share it across reruns and sessions.
+    Returns (df, fingerprint). The frame is shared, so treat it as
+    read-only. The cached computations below take the fingerprint as their
+    key instead of the DataFrame, which st.cache_data would hash in full
+    on every call.
+    """
+    # Categorical year keeps per-year filtering and lookups cheap
+    df = load_all_data().astype({"year": pd.CategoricalDtype(ordered=True)})
+    fingerprint = hash((
+        len(df),
+        df["ts"].min().value,
+        df["ts"].max().value,
+        int(df["ms_played"].sum()),
+    ))
+    return df, fingerprint
+
+
+def get_year_views(df: pd.DataFrame) -> dict:
+    """Split data into per-year DataFrames, with None mapping to All Time."""
+    year_views = {year: filter_year(df, year) for year in df["year"].cat.categories}
+    year_views[None] = df
+    return year_views
+
+
 @st.cache_data(ttl=3600)
-def get_data():
-    """Load data with Streamlit caching."""
-    return load_all_data()
+def get_dashboard_aggregates(fingerprint: int) -> dict:
+    """
+    Precompute every Dashboard tab aggregate once per data load.
+    Per-year metrics are keyed by year, with None for All Time.
+    """
+    df, _ = get_data()
+    year_views = get_year_views(df)
+    per_year_metrics = {
+        "top_albums": partial(get_top_albums, limit=20),
+        "top_artists": partial(get_top_artists, limit=20),
+        "top_tracks": partial(get_top_tracks_combined, limit=20),
+        "most_skipped": partial(get_most_skipped, limit=20),
+    }
 
+    # The aggregations are independent and pandas releases the GIL in its
+    # C kernels, so run them on a thread pool
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            metric: {year: executor.submit(compute, view) for year, view in year_views.items()}
+            for metric, compute in per_year_metrics.items()
+        }
+        not_on_playlist_stats = executor.submit(get_not_on_playlist_stats, df)
+        top_not_on_playlist = executor.submit(get_top_not_on_playlist, df, limit=20)
 
-def render_heatmap(df: pd.DataFrame, title: str = "Listening Activity", colorscale: str = "Greens"):
-    """Render a listening activity heatmap."""
-    heatmap_data = get_heatmap_data(df)
+        aggregates = {
+            metric: {year: future.result() for year, future in year_futures.items()}
+            for metric, year_futures in futures.items()
+        }
+        aggregates["not_on_playlist"] = (not_on_playlist_stats.result(), top_not_on_playlist.result())
 
-    # Filter to operating hours (8am-8pm)
-    hours = list(range(8, 21))
-    heatmap_data = heatmap_data[[h for h in hours if h in heatmap_data.columns]]
+    # Both top-track rankings come from one groupby per year
+    top_tracks = aggregates.pop("top_tracks")
+    aggregates["top_tracks_plays"] = {year: by_plays for year, (by_plays, _) in top_tracks.items()}
+    aggregates["top_tracks_minutes"] = {year: by_minutes for year, (_, by_minutes) in top_tracks.items()}
 
-    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    return aggregates
 
-    fig = go.Figure(data=go.Heatmap(
-        z=heatmap_data.values,
-        x=hours,
-        y=day_names,
-        colorscale=colorscale,
-        hovertemplate="Day: %{y}<br>Hour: %{x}:00<br>Plays: %{z}<extra></extra>",
-    ))
 
-    fig.update_layout(
-        title=title,
-        xaxis_title="Hour of Day",
-        yaxis_title="Day of Week",
-        xaxis=dict(tickmode="linear", dtick=2),
-        height=350,
-        margin=dict(l=0, r=0, t=40, b=0),
-    )
+@st.cache_data(ttl=3600, max_entries=64)
+def cached_search_tracks(fingerprint: int, query: str) -> pd.DataFrame:
+    """Cached search_tracks over the loaded data."""
+    return search_tracks(get_data()[0], query)
 
-    st.plotly_chart(fig, width="stretch")
 
+@st.cache_data(ttl=3600, max_entries=64)
+def cached_search_artists(fingerprint: int, query: str) -> pd.DataFrame:
+    """Cached search_artists over the loaded data."""
+    return search_artists(get_data()[0], query)
 
-def render_top_albums(df: pd.DataFrame, year: int = None):
-    """Render top albums bar chart."""
-    top = get_top_albums(df, year=year, limit=20)
-    top["label"] = top["album"] + " - " + top["artist"]
 
-    fig = px.bar(
-        top,
-        x="play_count",
-        y="label",
-        orientation="h",
-        title=f"Top Albums {f'({year})' if year else '(All Time)'}",
-        labels={"play_count": "Play Count", "label": ""},
-        color="total_minutes",
-        color_continuous_scale="Purples",
-    )
+@st.cache_data(ttl=3600, max_entries=64)
+def cached_track_stats(fingerprint: int, track: str, artist: str) -> dict:
+    """Cached get_track_stats over the loaded data."""
+    return get_track_stats(get_data()[0], track, artist)
 
-    fig.update_layout(
-        yaxis=dict(autorange="reversed"),
-        height=550,
-        margin=dict(l=0, r=0, t=40, b=0),
-        showlegend=False,
-        coloraxis_showscale=False,
-    )
 
-    st.plotly_chart(fig, width="stretch")
+@st.cache_data(ttl=3600, max_entries=64)
+def cached_artist_plays(fingerprint: int, artist: str) -> pd.DataFrame:
+    """Cached get_artist_plays over the loaded data."""
+    return get_artist_plays(get_data()[0], artist)
 
 
-def render_top_artists(df: pd.DataFrame, year: int = None):
-    """Render top artists bar chart."""
-    top = get_top_artists(df, year=year, limit=20)
+@st.cache_data(ttl=3600, max_entries=64)
+def cached_heatmap_data(fingerprint: int, artist: str, track: str = None) -> pd.DataFrame:
+    """Cached heatmap grid for an artist's plays, or one of their tracks."""
+    if track is None:
+        plays = cached_artist_plays(fingerprint, artist)
+    else:
+        plays = cached_track_stats(fingerprint, track, artist)["plays_df"]
+    return get_heatmap_data(plays)
 
-    fig = px.bar(
-        top,
-        x="play_count",
-        y="artist",
-        orientation="h",
-        title=f"Top Artists {f'({year})' if year else '(All Time)'}",
-        labels={"play_count": "Play Count", "artist": ""},
-        color="total_minutes",
-        color_continuous_scale="Greens",
+
+def render_heatmap(heatmap_data: pd.DataFrame, title: str = "Listening Activity", colorscale: str = "Greens", height: int = 350):
+    """Render a listening activity heatmap from get_heatmap_data output."""
+
+    # Filter to operating hours (8am-8pm), filling in days/hours with no plays
+    hours = list(range(8, 21))
+    heatmap_data = heatmap_data.reindex(index=range(7), columns=hours, fill_value=0)
+
+    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+    fig = px.imshow(
+        heatmap_data.values,
+        x=hours,
+        y=day_names,
+        color_continuous_scale=colorscale,
+        aspect="auto",
+        labels={"x": "Hour of Day", "y": "Day of Week", "color": "Plays"},
     )
+    fig.update_traces(hovertemplate="Day: %{y}<br>Hour: %{x}:00<br>Plays: %{z}<extra></extra>")
 
     fig.update_layout(
-        yaxis=dict(autorange="reversed"),
-        height=550,
+        title=title,
+        xaxis=dict(tickmode="linear", dtick=2),
+        height=height,
         margin=dict(l=0, r=0, t=40, b=0),
-        showlegend=False,
-        coloraxis_showscale=False,
     )
 
     st.plotly_chart(fig, width="stretch")
 
 
-def render_top_tracks(df: pd.DataFrame, year: int = None):
-    """Render top tracks by play count bar chart."""
-    top = get_top_tracks(df, year=year, limit=20, by="plays")
-    top["label"] = top["track"] + " - " + top["artist"]
+@st.cache_data(ttl=3600)
+def get_playlist_overview() -> dict:
+    """
+    Playlists tab data that doesn't depend on any widget.
+    Streamlit runs every tab's body on each rerun, so this would otherwise
+    be recomputed on every Dashboard or Search interaction.
+    """
+    return {
+        "summary": get_overall_playlist_summary(),
+        "stats": get_playlist_stats(),
+        "names": get_playlist_names(),
+        "artist_distribution": get_artist_playlist_distribution(limit=15),
+        "duplicates": get_track_duplicates(),
+    }
+
+
+@st.cache_data(ttl=3600, max_entries=64)
+def get_playlist_details(playlist_name: str) -> dict:
+    """Top artists, track list and cross-playlist overlaps for one playlist."""
+    return {
+        "top_artists": get_playlist_top_artists(playlist_name, limit=15),
+        "tracks": get_playlist_tracks(playlist_name),
+        "overlaps": get_playlist_track_overlaps(playlist_name),
+    }
 
-    fig = px.bar(
-        top,
-        x="play_count",
-        y="label",
+
+def build_bar_trace(
+    top: pd.DataFrame,
+    x: str,
+    y: str,
+    color: str,
+    colorscale: str,
+    x_title: str,
+) -> go.Bar:
+    """
+    Build a horizontal top-N bar trace straight from numpy arrays.
+    Skips plotly.express's DataFrame inspection for this fixed schema.
+    """
+    return go.Bar(
+        x=top[x].to_numpy(),
+        y=top[y].to_numpy(),
         orientation="h",
-        title=f"Top Tracks by Plays {f'({year})' if year else '(All Time)'}",
-        labels={"play_count": "Play Count", "label": ""},
-        color="total_minutes",
-        color_continuous_scale="Blues",
+        marker=dict(color=top[color].to_numpy(), colorscale=colorscale),
+        hovertemplate=f"%{{y}}<br>{x_title}: %{{x:,.0f}}<extra></extra>",
     )
 
+
+def build_bar_figure(
+    top: pd.DataFrame,
+    x: str,
+    y: str,
+    color: str,
+    colorscale: str,
+    title: str,
+    x_title: str,
+) -> go.Figure:
+    """Build a single horizontal top-N bar chart."""
+    fig = go.Figure(data=[build_bar_trace(top, x, y, color, colorscale, x_title)])
+
     fig.update_layout(
+        title=title,
+        xaxis_title=x_title,
         yaxis=dict(autorange="reversed"),
         height=550,
         margin=dict(l=0, r=0, t=40, b=0),
         showlegend=False,
-        coloraxis_showscale=False,
     )
 
-    st.plotly_chart(fig, width="stretch")
-
+    return fig
 
-def render_top_tracks_by_minutes(df: pd.DataFrame, year: int = None):
-    """Render top tracks by total minutes bar chart."""
-    top = get_top_tracks(df, year=year, limit=20, by="minutes")
-    top["label"] = top["track"] + " - " + top["artist"]
 
-    fig = px.bar(
-        top,
-        x="total_minutes",
-        y="label",
-        orientation="h",
-        title=f"Top Tracks by Minutes {f'({year})' if year else '(All Time)'}",
-        labels={"total_minutes": "Minutes Listened", "label": ""},
-        color="play_count",
-        color_continuous_scale="Oranges",
+def render_bar_row(panels: list[dict], year: int = None):
+    """
+    Render top-N bar charts side by side as one subplot figure.
+    Each panel is a dict of build_bar_trace arguments plus a title. One
+    figure per row means one Plotly.js instance instead of one per chart.
+    """
+    fig = make_subplots(
+        rows=1,
+        cols=len(panels),
+        subplot_titles=[panel["title"] for panel in panels],
+        horizontal_spacing=0.3,
     )
 
+    for col, panel in enumerate(panels, start=1):
+        top = panel["top"]
+        fig.update_yaxes(autorange="reversed", row=1, col=col)
+
+        if top.empty or top[panel["x"]].max() == 0:
+            fig.update_xaxes(visible=False, row=1, col=col)
+            fig.update_yaxes(visible=False, row=1, col=col)
+            fig.add_annotation(
+                text="No data for this period",
+                x=0.5,
+                y=0.5,
+                xref="x domain",
+                yref="y domain",
+                showarrow=False,
+                row=1,
+                col=col,
+            )
+            continue
+
+        fig.add_trace(
+            build_bar_trace(
+                top,
+                x=panel["x"],
+                y=panel["y"],
+                color=panel["color"],
+                colorscale=panel["colorscale"],
+                x_title=panel["x_title"],
+            ),
+            row=1,
+            col=col,
+        )
+        fig.update_xaxes(title_text=panel["x_title"], row=1, col=col)
+
     fig.update_layout(
-        yaxis=dict(autorange="reversed"),
         height=550,
         margin=dict(l=0, r=0, t=40, b=0),
         showlegend=False,
-        coloraxis_showscale=False,
     )
 
-    st.plotly_chart(fig, width="stretch")
+    st.plotly_chart(fig, width="stretch", config=STATIC_CHART_CONFIG if year is None else None)
 
 
-def render_not_on_playlist(df: pd.DataFrame):
+def render_row_top_albums_artists(albums: pd.DataFrame, artists: pd.DataFrame, year: int = None):
+    """Render top albums and top artists bar charts in one row."""
+    period = f"({year})" if year else "(All Time)"
+    render_bar_row([
+        dict(
+            top=albums,
+            x="play_count",
+            y="album_label",
+            color="total_minutes",
+            colorscale="Purples",
+            title=f"Top Albums {period}",
+            x_title="Play Count",
+        ),
+        dict(
+            top=artists,
+            x="play_count",
+            y="artist",
+            color="total_minutes",
+            colorscale="Greens",
+            title=f"Top Artists {period}",
+            x_title="Play Count",
+        ),
+    ], year=year)
+
+
+def render_row_top_tracks(by_plays: pd.DataFrame, by_minutes: pd.DataFrame, year: int = None):
+    """Render top tracks by play count and by total minutes in one row."""
+    period = f"({year})" if year else "(All Time)"
+    render_bar_row([
+        dict(
+            top=by_plays,
+            x="play_count",
+            y="track_label",
+            color="total_minutes",
+            colorscale="Blues",
+            title=f"Top Tracks by Plays {period}",
+            x_title="Play Count",
+        ),
+        dict(
+            top=by_minutes,
+            x="total_minutes",
+            y="track_label",
+            color="play_count",
+            colorscale="Oranges",
+            title=f"Top Tracks by Minutes {period}",
+            x_title="Minutes Listened",
+        ),
+    ], year=year)
+
+
+def render_not_on_playlist(stats: dict, top: pd.DataFrame):
     """Render stats and top tracks not on any playlist."""
-    stats = get_not_on_playlist_stats(df)
-    top = get_top_not_on_playlist(df, limit=20)
-
     st.markdown("### Not On Any Playlist")
     st.caption(f"{stats['not_on_playlist_count']:,} tracks ({stats['not_on_playlist_percent']}%) played but not saved to playlists")
 
     if not top.empty:
-        top_display = top.copy()
-        top_display["label"] = top_display["track"] + " - " + top_display["artist"]
-
-        fig = px.bar(
-            top_display,
+        fig = build_bar_figure(
+            top,
             x="play_count",
-            y="label",
-            orientation="h",
-            title="Most Played (Not on Playlist)",
-            labels={"play_count": "Plays", "label": ""},
+            y="track_label",
             color="total_minutes",
-            color_continuous_scale="Reds",
-        )
-
-        fig.update_layout(
-            yaxis=dict(autorange="reversed"),
-            height=550,
-            margin=dict(l=0, r=0, t=40, b=0),
-            showlegend=False,
-            coloraxis_showscale=False,
+            colorscale="Reds",
+            title="Most Played (Not on Playlist)",
+            x_title="Plays",
         )
 
-        st.plotly_chart(fig, width="stretch")
+        st.plotly_chart(fig, width="stretch", config=STATIC_CHART_CONFIG)
 
 
-def render_most_skipped(df: pd.DataFrame):
+def render_most_skipped(top: pd.DataFrame, year: int = None):
     """Render most skipped tracks bar chart."""
-    top = get_most_skipped(df, limit=20)
-    top["label"] = top["track"] + " - " + top["artist"]
+    if top.empty or top["skip_count"].max() == 0:
+        st.info("No data for this period")
+        return
 
-    fig = px.bar(
+    fig = build_bar_figure(
         top,
         x="skip_count",
-        y="label",
-        orientation="h",
-        title="Most Skipped Tracks",
-        labels={"skip_count": "Skip Count", "label": ""},
+        y="track_label",
         color="skip_count",
-        color_continuous_scale="Reds",
-    )
-
-    fig.update_layout(
-        yaxis=dict(autorange="reversed"),
-        height=550,
-        margin=dict(l=0, r=0, t=40, b=0),
-        showlegend=False,
-        coloraxis_showscale=False,
+        colorscale="Reds",
+        title="Most Skipped Tracks",
+        x_title="Skip Count",
     )
 
-    st.plotly_chart(fig, width="stretch")
+    st.plotly_chart(fig, width="stretch", config=STATIC_CHART_CONFIG if year is None else None)
 
 
-def render_search_results(df: pd.DataFrame, query: str):
+def render_search_results(fingerprint: int, query: str):
     """Render search results for a track/artist query."""
-    results = search_tracks(df, query)
+    results = cached_search_tracks(fingerprint, query)
 
     if results.empty:
         st.warning(f"No results found for '{query}'")
@@ -274,29 +424,26 @@ def render_search_results(df: pd.DataFrame, query: str):
 
     st.subheader(f"Search Results for '{query}'")
 
-    # Show results table
-    display_df = results.copy()
-    display_df["total_minutes"] = display_df["total_minutes"].round(1)
-    display_df = display_df.rename(columns={
-        "track": "Track",
-        "artist": "Artist",
-        "album": "Album",
-        "play_count": "Plays",
-        "total_minutes": "Minutes",
-        "first_played": "First Played",
-        "last_played": "Last Played",
-    })
-
+    # Show results table (labels and rounding via column_config, no copy)
     st.dataframe(
-        display_df,
+        results,
         width="stretch",
         hide_index=True,
+        column_config={
+            "track": "Track",
+            "artist": "Artist",
+            "album": "Album",
+            "play_count": "Plays",
+            "total_minutes": st.column_config.NumberColumn("Minutes", format="%.1f"),
+            "first_played": "First Played",
+            "last_played": "Last Played",
+        },
     )
 
     # If there's a top result, show detailed stats
     if len(results) > 0:
         top_result = results.iloc[0]
-        stats = get_track_stats(df, top_result["track"], top_result["artist"])
+        stats = cached_track_stats(fingerprint, top_result["track"], top_result["artist"])
 
         if stats:
             st.markdown("---")
@@ -332,42 +479,17 @@ def render_search_results(df: pd.DataFrame, query: str):
                 st.plotly_chart(fig, width="stretch")
 
             # Show play history heatmap for this track
-            render_track_heatmap(stats["plays_df"])
+            render_track_heatmap(cached_heatmap_data(fingerprint, top_result["artist"], track=top_result["track"]))
 
 
-def render_track_heatmap(plays_df: pd.DataFrame):
+def render_track_heatmap(heatmap_data: pd.DataFrame):
     """Render a heatmap for a specific track's play history."""
-    heatmap_data = get_heatmap_data(plays_df)
-
-    # Filter to operating hours (8am-8pm)
-    hours = list(range(8, 21))
-    heatmap_data = heatmap_data[[h for h in hours if h in heatmap_data.columns]]
-
-    day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
-    fig = go.Figure(data=go.Heatmap(
-        z=heatmap_data.values,
-        x=hours,
-        y=day_names,
-        colorscale="Blues",
-        hovertemplate="Day: %{y}<br>Hour: %{x}:00<br>Plays: %{z}<extra></extra>",
-    ))
-
-    fig.update_layout(
-        title="When You Listen to This Track",
-        xaxis_title="Hour of Day",
-        yaxis_title="Day of Week",
-        xaxis=dict(tickmode="linear", dtick=2),
-        height=300,
-        margin=dict(l=0, r=0, t=40, b=0),
-    )
-
-    st.plotly_chart(fig, width="stretch")
+    render_heatmap(heatmap_data, title="When You Listen to This Track", colorscale="Blues", height=300)
 
 
-def render_artist_search_results(df: pd.DataFrame, query: str):
+def render_artist_search_results(fingerprint: int, query: str):
     """Render search results for an artist query with heatmap."""
-    results = search_artists(df, query)
+    results = cached_search_artists(fingerprint, query)
 
     if results.empty:
         st.warning(f"No artists found for '{query}'")
@@ -375,28 +497,25 @@ def render_artist_search_results(df: pd.DataFrame, query: str):
 
     st.subheader(f"Artist Results for '{query}'")
 
-    # Show results table
-    display_df = results.copy()
-    display_df["total_minutes"] = display_df["total_minutes"].round(1)
-    display_df = display_df.rename(columns={
-        "artist": "Artist",
-        "play_count": "Plays",
-        "total_minutes": "Minutes",
-        "unique_tracks": "Unique Tracks",
-        "first_played": "First Played",
-        "last_played": "Last Played",
-    })
-
+    # Show results table (labels and rounding via column_config, no copy)
     st.dataframe(
-        display_df,
+        results,
         width="stretch",
         hide_index=True,
+        column_config={
+            "artist": "Artist",
+            "play_count": "Plays",
+            "total_minutes": st.column_config.NumberColumn("Minutes", format="%.1f"),
+            "unique_tracks": "Unique Tracks",
+            "first_played": "First Played",
+            "last_played": "Last Played",
+        },
     )
 
     # Show details for the top result
     if len(results) > 0:
         top_artist = results.iloc[0]["artist"]
-        artist_plays = get_artist_plays(df, top_artist)
+        artist_plays = cached_artist_plays(fingerprint, top_artist)
 
         st.markdown("---")
         st.subheader(f"Details: {top_artist}")
@@ -404,18 +523,19 @@ def render_artist_search_results(df: pd.DataFrame, query: str):
         col1, col2, col3, col4 = st.columns(4)
         col1.metric("Total Plays", f"{len(artist_plays):,}")
         col2.metric("Unique Tracks", f"{artist_plays['track'].nunique():,}")
-        col3.metric("Hours Listened", f"{artist_plays['minutes_played'].sum() / 60:.1f}")
+        col3.metric("Hours Listened", f"{artist_plays['ms_played'].sum() / MS_PER_MINUTE / 60:.1f}")
         col4.metric("First Played", artist_plays["ts"].min().strftime("%Y-%m-%d"))
 
         # Heatmap for this artist
-        render_heatmap(artist_plays, title=f"When You Listen to {top_artist}", colorscale="Purples")
+        render_heatmap(cached_heatmap_data(fingerprint, top_artist), title=f"When You Listen to {top_artist}", colorscale="Purples")
 
         # Top tracks by this artist
         st.subheader(f"Top Tracks by {top_artist}")
-        top_tracks = artist_plays.groupby("track").agg(
+        top_tracks = artist_plays.groupby("track", observed=True).agg(
             play_count=("ts", "count"),
-            total_minutes=("minutes_played", "sum"),
-        ).reset_index().sort_values("play_count", ascending=False).head(10)
+            ms_played=("ms_played", "sum"),
+        ).nlargest(10, "play_count").reset_index()
+        top_tracks["total_minutes"] = top_tracks["ms_played"] / MS_PER_MINUTE
 
         fig = px.bar(
             top_tracks,
@@ -443,7 +563,7 @@ def render_stats_overview(df: pd.DataFrame):
     col1.metric("Total Plays", f"{len(df):,}")
     col2.metric("Unique Tracks", f"{df['track'].nunique():,}")
     col3.metric("Unique Artists", f"{df['artist'].nunique():,}")
-    col4.metric("Hours Listened", f"{df['minutes_played'].sum() / 60:,.0f}")
+    col4.metric("Hours Listened", f"{df['ms_played'].sum() / MS_PER_MINUTE / 60:,.0f}")
 
 
 def main():
@@ -451,7 +571,10 @@ def main():
 
     # Load data
     with st.spinner("Loading data..."):
-        df = get_data()
+        df, fingerprint = get_data()
+
+    # Dashboard aggregates (cached alongside the data)
+    aggregates = get_dashboard_aggregates(fingerprint)
 
     # Overview stats
     render_stats_overview(df)
@@ -463,7 +586,7 @@ def main():
 
     with tab1:
         # Year filter
-        years = sorted(df["year"].unique())
+        years = list(df["year"].cat.categories)
         selected_year = st.selectbox(
             "Filter by Year",
             options=[None] + years,
@@ -471,33 +594,31 @@ def main():
             key="dashboard_year",
         )
 
-        filtered_df = df if selected_year is None else df[df["year"] == selected_year]
-
         # Top albums and top artists
-        col1, col2 = st.columns(2)
-        with col1:
-            render_top_albums(df, year=selected_year)
-        with col2:
-            render_top_artists(df, year=selected_year)
+        render_row_top_albums_artists(
+            aggregates["top_albums"][selected_year],
+            aggregates["top_artists"][selected_year],
+            year=selected_year,
+        )
 
         st.markdown("---")
 
         # Top tracks by plays and by minutes
-        col1, col2 = st.columns(2)
-        with col1:
-            render_top_tracks(df, year=selected_year)
-        with col2:
-            render_top_tracks_by_minutes(df, year=selected_year)
+        render_row_top_tracks(
+            aggregates["top_tracks_plays"][selected_year],
+            aggregates["top_tracks_minutes"][selected_year],
+            year=selected_year,
+        )
 
         st.markdown("---")
 
         # Most skipped
-        render_most_skipped(filtered_df)
+        render_most_skipped(aggregates["most_skipped"][selected_year], year=selected_year)
 
         st.markdown("---")
 
         # Not on any playlist
-        render_not_on_playlist(df)
+        render_not_on_playlist(*aggregates["not_on_playlist"])
 
     with tab2:
         st.subheader("Search")
@@ -519,9 +640,9 @@ def main():
 
             if query:
                 if search_type == "Tracks":
-                    render_search_results(df, query)
+                    render_search_results(fingerprint, query)
                 else:
-                    render_artist_search_results(df, query)
+                    render_artist_search_results(fingerprint, query)
 
         search_fragment()
 
@@ -529,8 +650,9 @@ def main():
         st.subheader("Playlist Analysis")
 
         # Overall summary
-        summary = get_overall_playlist_summary()
-        playlist_stats = get_playlist_stats()
+        overview = get_playlist_overview()
+        summary = overview["summary"]
+        playlist_stats = overview["stats"]
 
         if summary:
             col1, col2, col3, col4 = st.columns(4)
@@ -568,7 +690,7 @@ def main():
 
         # Playlist deep dive
         st.markdown("### Explore a Playlist")
-        playlist_names = get_playlist_names()
+        playlist_names = overview["names"]
 
         if playlist_names:
             selected_playlist = st.selectbox(
@@ -578,11 +700,12 @@ def main():
             )
 
             if selected_playlist:
+                details = get_playlist_details(selected_playlist)
                 col1, col2 = st.columns(2)
 
                 with col1:
                     # Top artists in this playlist
-                    top_artists = get_playlist_top_artists(selected_playlist, limit=15)
+                    top_artists = details["top_artists"]
                     if not top_artists.empty:
                         fig = px.bar(
                             top_artists,
@@ -605,7 +728,7 @@ def main():
 
                 with col2:
                     # Track list for this playlist
-                    tracks = get_playlist_tracks(selected_playlist)
+                    tracks = details["tracks"]
                     if not tracks.empty:
                         st.markdown(f"**{len(tracks)} tracks**")
                         display_df = tracks[["track", "artist", "album"]].rename(columns={
@@ -616,7 +739,7 @@ def main():
                         st.dataframe(display_df, width="stretch", hide_index=True, height=400)
 
                 # Tracks that appear in other playlists
-                overlaps = get_playlist_track_overlaps(selected_playlist)
+                overlaps = details["overlaps"]
                 if not overlaps.empty:
                     st.markdown(f"#### Tracks Also in Other Playlists ({len(overlaps)} found)")
                     st.caption("These tracks from this playlist also appear elsewhere - consider removing for freshness")
@@ -652,7 +775,7 @@ def main():
                 col2.metric("Shared Artists", overlap['shared_artist_count'])
                 col3.metric(f"{playlist2}", f"{overlap['p2_track_count']} tracks")
 
-                if overlap['shared_tracks']:
+                if overlap['shared_track_count']:
                     st.markdown(f"**{overlap['shared_track_count']} shared tracks:**")
                     shared_df = pd.DataFrame(overlap['shared_tracks'])
                     shared_df = shared_df.rename(columns={"track": "Track", "artist": "Artist"})
@@ -672,7 +795,7 @@ def main():
         with col1:
             # Artists in the most playlists
             st.markdown("**Artists in Most Playlists**")
-            artist_dist = get_artist_playlist_distribution(limit=15)
+            artist_dist = overview["artist_distribution"]
             if not artist_dist.empty:
                 fig = px.bar(
                     artist_dist,
@@ -696,7 +819,7 @@ def main():
         with col2:
             # Duplicate tracks across playlists
             st.markdown("**Tracks in Multiple Playlists**")
-            dupes = get_track_duplicates()
+            dupes = overview["duplicates"]
             if not dupes.empty:
                 dupes_display = dupes.head(15).copy()
                 dupes_display["label"] = dupes_display["track"] + " - " + dupes_display["artist"]
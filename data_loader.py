@@ -3,12 +3,30 @@ Spotify streaming history data loader and preprocessor.
 Loads JSON files from StreamingHistory/ and prepares data for visualization.
 """
 
+import hashlib
 import json
+import logging
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    STRING_DTYPE = pd.ArrowDtype(pa.string())
+except ImportError:
+    STRING_DTYPE = "string"
+
 # Timezone for displaying times (Spotify stores UTC)
 LOCAL_TIMEZONE = "America/New_York"  # Eastern Time
 
@@ -20,8 +38,15 @@ from spotify_api import (
 )
 
 
+logger = logging.getLogger(__name__)
+
 DATA_DIR = Path(__file__).parent / "StreamingHistory"
 
+MS_PER_MINUTE = 60_000
+
+# Processed-data snapshot, reused across process restarts
+CACHE_DIR = Path(__file__).parent / ".cache"
+
 # Playlists to exclude from analysis
 EXCLUDED_PLAYLISTS = [
     "SD/TB - Thanks 4 Sharing",
@@ -30,25 +55,79 @@ EXCLUDED_PLAYLISTS = [
 
 
 def load_single_file(filepath: Path) -> list[dict]:
-    """Load a single JSON streaming history file."""
+    """Load a single JSON streaming history file (with orjson if installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(filepath.read_bytes())
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def snapshot_path(source_files: list[Path]) -> Path:
+    """
+    Path of the processed-data snapshot for these source files.
+    The name hashes each file's name, size and mtime (and this module's, so
+    preprocessing changes invalidate it).
+    """
+    digest = hashlib.sha1()
+    for path in [*source_files, Path(__file__)]:
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return CACHE_DIR / f"history-{digest.hexdigest()[:16]}.parquet"
+
+
+def load_snapshot(path: Path) -> pd.DataFrame | None:
+    """Load a processed-data snapshot. Returns None if missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        return None
+
+
+def save_snapshot(df: pd.DataFrame, path: Path):
+    """
+    Save processed data as a Parquet snapshot, replacing older ones
+    (skipped if pyarrow is unavailable). Written to a per-process temp file
+    and renamed into place, so a crash or a concurrent writer never leaves
+    a truncated snapshot behind.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, path)
+        for stale in CACHE_DIR.glob("history-*.parquet"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except Exception as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning("Could not save data snapshot: %s", e)
+
+
 @lru_cache(maxsize=1)
 def load_all_data() -> pd.DataFrame:
     """
     Load and combine all streaming history JSON files.
-    Results are cached for performance.
+    Results are cached for performance, in memory and as an on-disk
+    snapshot of the processed data.
     """
-    all_records = []
+    source_files = sorted(DATA_DIR.glob("Streaming_History_Audio_*.json"))
 
-    for filepath in sorted(DATA_DIR.glob("Streaming_History_Audio_*.json")):
-        records = load_single_file(filepath)
-        all_records.extend(records)
+    snapshot_file = snapshot_path(source_files)
+    snapshot = load_snapshot(snapshot_file)
+    if snapshot is not None:
+        return snapshot
 
-    df = pd.DataFrame(all_records)
-    return preprocess_data(df)
+    # One frame per file, so no combined list of every record is held.
+    # Files are independent, so read and parse them on a thread pool
+    with ThreadPoolExecutor() as executor:
+        frames = list(executor.map(lambda filepath: pd.DataFrame(load_single_file(filepath)), source_files))
+
+    df = pd.concat(frames, ignore_index=True)
+    df = preprocess_data(df)
+    save_snapshot(df, snapshot_file)
+    return df
 
 
 def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -56,26 +135,31 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     Preprocess the raw streaming data.
     - Parse timestamps and convert to local timezone
     - Add time-based columns for analysis
-    - Convert ms_played to minutes
+    - Store ms_played as int32 (minutes are derived after aggregating)
     - Filter to music only (exclude podcasts/audiobooks)
+    - Sort chronologically, so each year is a contiguous block of rows
+    - Store repeated string columns as categoricals
+    - Add lowercase copies of track/artist/album (and a combined blob) for searching
     """
     # Parse timestamp (Spotify uses UTC with 'Z' suffix)
-    df["ts"] = pd.to_datetime(df["ts"], utc=True)
+    df["ts"] = pd.to_datetime(df["ts"], format="%Y-%m-%dT%H:%M:%SZ", utc=True, cache=True)
 
     # Convert to local timezone for time-based analysis
     ts_local = df["ts"].dt.tz_convert(LOCAL_TIMEZONE)
 
-    # Add time-based columns for analysis (using local time)
-    df["year"] = ts_local.dt.year
-    df["month"] = ts_local.dt.month
-    df["day"] = ts_local.dt.day
-    df["hour"] = ts_local.dt.hour
-    df["day_of_week"] = ts_local.dt.dayofweek  # 0=Monday, 6=Sunday
+    # Add time-based columns for analysis (using local time), in the
+    # smallest dtypes that fit to cut memory traffic in groupbys
+    df["year"] = ts_local.dt.year.astype("int16")
+    df["month"] = ts_local.dt.month.astype("int8")
+    df["day"] = ts_local.dt.day.astype("int8")
+    df["hour"] = ts_local.dt.hour.astype("int8")
+    df["day_of_week"] = ts_local.dt.dayofweek.astype("int8")  # 0=Monday, 6=Sunday
     df["day_name"] = ts_local.dt.day_name()
     df["date"] = ts_local.dt.date
 
-    # Convert ms to minutes
-    df["minutes_played"] = df["ms_played"] / 60000
+    # A single play is far below int32's ~24 days of milliseconds. Minutes
+    # are derived from summed ms_played after aggregating, not stored per row
+    df["ms_played"] = df["ms_played"].astype("int32")
 
     # Rename columns for clarity
     df = df.rename(columns={
@@ -89,19 +173,86 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
         df["track"].notna() &
         df["episode_name"].isna() &
         df["audiobook_title"].isna()
-    ].copy()
+    ].sort_values("ts", kind="stable").reset_index(drop=True)
+
+    # Categorical dtype for repeated string columns: groupbys hash integer
+    # codes instead of Python strings, and memory drops severalfold
+    for col in ("track", "artist", "album", "reason_start", "reason_end", "platform", "day_name"):
+        music_df[col] = music_df[col].astype("category")
+
+    # Lowercased copies of the searchable names, so queries never lowercase
+    # at lookup time. Built per row rather than by renaming categories, as
+    # names differing only in case collapse to one lowercase category
+    for col in ("track", "artist", "album"):
+        music_df[f"{col}_lower"] = music_df[col].str.lower().astype("category")
+
+    # Track search matches any of the three names; joining them per row
+    # (NUL-separated so a match can't span fields) lets it test each
+    # distinct combination in a single pass
+    music_df["search_blob"] = (
+        music_df["track_lower"].astype(STRING_DTYPE) + "\0" +
+        music_df["artist_lower"].astype(STRING_DTYPE).fillna("") + "\0" +
+        music_df["album_lower"].astype(STRING_DTYPE).fillna("")
+    ).astype("category")
+
+    # Arrow-backed strings for the remaining free-text columns: contiguous
+    # UTF-8 buffers instead of one Python object per value
+    for col in ("conn_country", "spotify_track_uri", "episode_name", "episode_show_name", "spotify_episode_uri"):
+        if col in music_df:
+            music_df[col] = music_df[col].astype(STRING_DTYPE)
+
+    # Chart labels, built once here instead of on every render
+    artist = music_df["artist"].astype(STRING_DTYPE)
+    music_df["track_label"] = music_df["track"].astype(STRING_DTYPE) + " - " + artist
+    music_df["album_label"] = music_df["album"].astype(STRING_DTYPE) + " - " + artist
+
+    # Repeated on every play of a track, so categorical like the name columns
+    music_df["track_label"] = music_df["track_label"].astype("category")
 
     return music_df
 
 
+def filter_year(df: pd.DataFrame, year: int = None) -> pd.DataFrame:
+    """
+    Rows for one year (all rows if year is None).
+    preprocess_data sorts by timestamp, so a year is a contiguous block
+    found by binary search and returned as a slice, not a boolean mask.
+    """
+    if year is None:
+        return df
+    years = df["year"]
+    if not years.is_monotonic_increasing:
+        return df[years == year]
+    start, stop = years.searchsorted(year, side="left"), years.searchsorted(year, side="right")
+    return df.iloc[start:stop]
+
+
+def _ms_to_minutes(stats: pd.DataFrame) -> pd.DataFrame:
+    """Replace a summed ms_played column with total_minutes, in the same position."""
+    loc = stats.columns.get_loc("ms_played")
+    stats.insert(loc, "total_minutes", stats.pop("ms_played") / MS_PER_MINUTE)
+    return stats
+
+
+def _category_mask(col: pd.Series, predicate) -> np.ndarray:
+    """
+    Row mask for a categorical column from a predicate over its categories,
+    so each distinct name is tested only once. Missing values never match.
+    """
+    hits = np.asarray(predicate(col.cat.categories), dtype=bool)
+    return np.append(hits, False)[col.cat.codes.to_numpy()]
+
+
 def get_track_stats(df: pd.DataFrame, track_name: str, artist_name: str = None) -> dict:
     """
     Get statistics for a specific track.
     Optionally filter by artist for tracks with same name.
     """
-    mask = df["track"].str.lower() == track_name.lower()
+    track_lower = track_name.lower()
+    mask = _category_mask(df["track_lower"], lambda names: names == track_lower)
     if artist_name:
-        mask &= df["artist"].str.lower() == artist_name.lower()
+        artist_lower = artist_name.lower()
+        mask &= _category_mask(df["artist_lower"], lambda names: names == artist_lower)
 
     track_df = df[mask]
 
@@ -113,10 +264,10 @@ def get_track_stats(df: pd.DataFrame, track_name: str, artist_name: str = None)
         "artist": track_df["artist"].iloc[0],
         "album": track_df["album"].iloc[0],
         "play_count": len(track_df),
-        "total_minutes": track_df["minutes_played"].sum(),
+        "total_minutes": track_df["ms_played"].sum() / MS_PER_MINUTE,
         "first_played": track_df["ts"].min(),
         "last_played": track_df["ts"].max(),
-        "plays_by_year": track_df.groupby("year").size().to_dict(),
+        "plays_by_year": track_df.groupby("year", observed=True).size().to_dict(),
         "plays_df": track_df,  # For detailed analysis
     }
 
@@ -129,11 +280,7 @@ def search_tracks(df: pd.DataFrame, query: str, limit: int = 50) -> pd.DataFrame
     query_lower = query.lower()
 
     # Search in track name, artist, and album
-    mask = (
-        df["track"].str.lower().str.contains(query_lower, na=False) |
-        df["artist"].str.lower().str.contains(query_lower, na=False) |
-        df["album"].str.lower().str.contains(query_lower, na=False)
-    )
+    mask = _category_mask(df["search_blob"], lambda blobs: blobs.str.contains(query_lower, regex=False))
 
     matches = df[mask]
 
@@ -141,14 +288,16 @@ def search_tracks(df: pd.DataFrame, query: str, limit: int = 50) -> pd.DataFrame
         return pd.DataFrame()
 
     # Aggregate by track + artist
-    stats = matches.groupby(["track", "artist", "album"]).agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-        first_played=("ts", "min"),
-        last_played=("ts", "max"),
-    ).reset_index()
+    stats = _ms_to_minutes(
+        matches.groupby(["track", "artist", "album"], observed=True).agg(
+            play_count=("ts", "count"),
+            ms_played=("ms_played", "sum"),
+            first_played=("ts", "min"),
+            last_played=("ts", "max"),
+        ).reset_index()
+    )
 
-    stats = stats.sort_values("play_count", ascending=False).head(limit)
+    stats = stats.nlargest(limit, "play_count")
     return stats
 
 
@@ -158,47 +307,50 @@ def search_artists(df: pd.DataFrame, query: str, limit: int = 20) -> pd.DataFram
     Returns aggregated stats per artist.
     """
     query_lower = query.lower()
-    mask = df["artist"].str.lower().str.contains(query_lower, na=False)
+    mask = _category_mask(df["artist_lower"], lambda names: names.str.contains(query_lower, regex=False))
     matches = df[mask]
 
     if matches.empty:
         return pd.DataFrame()
 
-    stats = matches.groupby("artist").agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-        unique_tracks=("track", "nunique"),
-        first_played=("ts", "min"),
-        last_played=("ts", "max"),
-    ).reset_index()
+    stats = _ms_to_minutes(
+        matches.groupby("artist", observed=True).agg(
+            play_count=("ts", "count"),
+            ms_played=("ms_played", "sum"),
+            unique_tracks=("track", "nunique"),
+            first_played=("ts", "min"),
+            last_played=("ts", "max"),
+        ).reset_index()
+    )
 
-    stats = stats.sort_values("play_count", ascending=False).head(limit)
+    stats = stats.nlargest(limit, "play_count")
     return stats
 
 
 def get_artist_plays(df: pd.DataFrame, artist_name: str) -> pd.DataFrame:
     """Get all plays for a specific artist."""
-    mask = df["artist"].str.lower() == artist_name.lower()
+    artist_lower = artist_name.lower()
+    mask = _category_mask(df["artist_lower"], lambda names: names == artist_lower)
     return df[mask].copy()
 
 
 def get_top_albums(df: pd.DataFrame, year: int = None, limit: int = 20) -> pd.DataFrame:
     """Get top albums by play count, optionally filtered by year."""
-    filtered = df if year is None else df[df["year"] == year]
-
-    stats = filtered.groupby(["album", "artist"]).agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-    ).reset_index()
+    filtered = filter_year(df, year)
+
+    stats = _ms_to_minutes(
+        filtered.groupby(["album", "artist"], observed=True).agg(
+            play_count=("ts", "count"),
+            ms_played=("ms_played", "sum"),
+            album_label=("album_label", "first"),
+        ).reset_index()
+    )
 
-    return stats.sort_values("play_count", ascending=False).head(limit)
+    return stats.nlargest(limit, "play_count")
 
 
 def get_platform_stats(df: pd.DataFrame) -> pd.DataFrame:
     """Get listening stats by platform."""
-    # Simplify platform names
-    df_copy = df.copy()
-
     def simplify_platform(p):
         if pd.isna(p):
             return "Unknown"
@@ -218,12 +370,23 @@ def get_platform_stats(df: pd.DataFrame) -> pd.DataFrame:
         else:
             return "Other"
 
-    df_copy["platform_simple"] = df_copy["platform"].apply(simplify_platform)
+    # Simplify each distinct platform once; code -1 (missing) picks the
+    # trailing "Unknown"
+    platforms = df["platform"]
+    simplified = np.array([simplify_platform(p) for p in platforms.cat.categories] + ["Unknown"], dtype=object)
+    platform_simple = pd.Series(
+        pd.Categorical(simplified[platforms.cat.codes.to_numpy()]),
+        index=df.index,
+        name="platform_simple",
+    )
 
-    stats = df_copy.groupby("platform_simple").agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-    ).reset_index()
+    # Group by the derived series directly rather than a column on a copy
+    stats = _ms_to_minutes(
+        df.groupby(platform_simple, observed=True).agg(
+            play_count=("ts", "count"),
+            ms_played=("ms_played", "sum"),
+        ).reset_index()
+    )
 
     return stats.sort_values("play_count", ascending=False)
 
@@ -232,38 +395,139 @@ def get_heatmap_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Generate heatmap data for day of week × hour of day.
     """
-    heatmap = df.groupby(["day_of_week", "hour"]).size().reset_index(name="count")
+    # Count plays per cell of a flattened 7x24 grid in one pass
+    cells = df["day_of_week"].to_numpy(np.intp) * 24 + df["hour"].to_numpy(np.intp)
+    counts = np.bincount(cells, minlength=7 * 24).reshape(7, 24)
 
-    # Pivot for heatmap format
-    pivot = heatmap.pivot(index="day_of_week", columns="hour", values="count").fillna(0)
-
-    return pivot
+    return pd.DataFrame(counts, index=pd.RangeIndex(7, name="day_of_week"), columns=pd.RangeIndex(24, name="hour"))
 
 
 def get_top_artists(df: pd.DataFrame, year: int = None, limit: int = 20, by: str = "plays") -> pd.DataFrame:
     """Get top artists by play count or minutes, optionally filtered by year."""
-    filtered = df if year is None else df[df["year"] == year]
+    filtered = filter_year(df, year)
 
-    stats = filtered.groupby("artist").agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-    ).reset_index()
+    stats = _ms_to_minutes(
+        filtered.groupby("artist", observed=True).agg(
+            play_count=("ts", "count"),
+            ms_played=("ms_played", "sum"),
+        ).reset_index()
+    )
 
     sort_col = "play_count" if by == "plays" else "total_minutes"
-    return stats.sort_values(sort_col, ascending=False).head(limit)
+    return stats.nlargest(limit, sort_col)
 
 
 def get_top_tracks(df: pd.DataFrame, year: int = None, limit: int = 20, by: str = "plays") -> pd.DataFrame:
     """Get top tracks by play count or minutes, optionally filtered by year."""
-    filtered = df if year is None else df[df["year"] == year]
+    stats = _top_track_stats(df, year)
+    sort_col = "play_count" if by == "plays" else "total_minutes"
+    return stats.nlargest(limit, sort_col)
 
-    stats = filtered.groupby(["track", "artist"]).agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-    ).reset_index()
 
-    sort_col = "play_count" if by == "plays" else "total_minutes"
-    return stats.sort_values(sort_col, ascending=False).head(limit)
+def get_top_tracks_combined(df: pd.DataFrame, year: int = None, limit: int = 20) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Get top tracks by play count and by minutes from a single groupby.
+    Returns (by_plays, by_minutes).
+    """
+    stats = _top_track_stats(df, year)
+    return stats.nlargest(limit, "play_count"), stats.nlargest(limit, "total_minutes")
+
+
+def _top_track_stats(df: pd.DataFrame, year: int = None) -> pd.DataFrame:
+    """Play count and total minutes per (track, artist), optionally filtered by year."""
+    filtered = filter_year(df, year)
+
+    return _ms_to_minutes(
+        filtered.groupby(["track", "artist"], observed=True).agg(
+            play_count=("ts", "count"),
+            ms_played=("ms_played", "sum"),
+            track_label=("track_label", "first"),
+        ).reset_index()
+    )
+
+
+# Per-track totals by (id() of the source frame, by_album), dropped when
+# the frame is collected
+_track_totals_cache: dict[tuple[int, bool], pd.DataFrame] = {}
+
+
+def _track_totals(df: pd.DataFrame, by_album: bool = False) -> pd.DataFrame:
+    """
+    Per-track totals for df, computed once per DataFrame object.
+    The one-hit-wonder and not-on-playlist helpers all start from this
+    table, so repeated calls on the same frame skip the aggregation.
+    Returns a copy, so callers may add columns.
+    """
+    key = (id(df), by_album)
+    totals = _track_totals_cache.get(key)
+    if totals is None:
+        totals = _compute_track_totals(df, by_album)
+        _track_totals_cache[key] = totals
+        weakref.finalize(df, _track_totals_cache.pop, key, None)
+    return totals.copy()
+
+
+def _compute_track_totals(df: pd.DataFrame, by_album: bool = False) -> pd.DataFrame:
+    """
+    Per-track totals, one row per played (track, artist) pair, or per
+    (track, artist, album) if by_album. Counts and sums are np.bincount
+    passes over integer track ids rather than a multi-column groupby on
+    strings.
+    """
+    # Track id: the key columns' category codes combined into one integer,
+    # then made dense. Rows missing any key are dropped, as groupby would
+    keys = ["track", "artist", "album"] if by_album else ["track", "artist"]
+    key_codes = [df[col].cat.codes.to_numpy().astype(np.int64) for col in keys]
+    valid = np.logical_and.reduce([c >= 0 for c in key_codes])
+    ids = key_codes[0][valid]
+    for col, c in zip(keys[1:], key_codes[1:]):
+        ids = ids * len(df[col].cat.categories) + c[valid]
+    codes, uniques = pd.factorize(ids)
+    n_tracks = len(uniques)
+
+    play_count = np.bincount(codes, minlength=n_tracks)
+    ms_played = np.bincount(codes, weights=df["ms_played"].to_numpy()[valid], minlength=n_tracks)
+
+    ts = df["ts"].to_numpy(dtype="datetime64[ns]")[valid].view(np.int64)
+    last_played = np.full(n_tracks, np.iinfo(np.int64).min)
+    np.maximum.at(last_played, codes, ts)
+
+    # Any row of a track can stand in for its track/artist/album columns
+    rows = np.flatnonzero(valid)
+    sample_row = np.empty(n_tracks, dtype=np.intp)
+    sample_row[codes] = rows
+
+    totals = df[["track", "artist", "album", "track_label"]].iloc[sample_row].reset_index(drop=True)
+    totals["play_count"] = play_count
+    totals["ms_played"] = ms_played.astype(np.int64)
+    totals["total_minutes"] = ms_played / MS_PER_MINUTE
+    totals["last_played"] = pd.to_datetime(last_played, utc=True)
+    return totals
+
+
+def _track_artist_pairs(tracks: pd.DataFrame, case_sensitive: bool = True) -> pd.MultiIndex:
+    """(track, artist) pairs of a frame as a MultiIndex, lowercased unless case_sensitive."""
+    pairs = tracks[["track", "artist"]].astype("string")
+    if not case_sensitive:
+        pairs = pairs.apply(lambda col: col.str.lower())
+    return pd.MultiIndex.from_frame(pairs)
+
+
+@lru_cache(maxsize=2)
+def _playlist_pairs(case_sensitive: bool = True) -> pd.MultiIndex:
+    """(track, artist) pairs on any playlist."""
+    playlist_tracks = get_all_playlist_tracks()
+    if playlist_tracks.empty:
+        return pd.MultiIndex.from_arrays([[], []], names=["track", "artist"])
+    return _track_artist_pairs(playlist_tracks, case_sensitive)
+
+
+def get_playlist_track_mask(tracks: pd.DataFrame, case_sensitive: bool = True) -> np.ndarray:
+    """
+    Get a boolean mask over the rows of a per-track frame: True where that
+    (track, artist) pair is on any playlist.
+    """
+    return _track_artist_pairs(tracks, case_sensitive).isin(_playlist_pairs(case_sensitive))
 
 
 def get_one_hit_wonders(df: pd.DataFrame, limit: int = 50) -> pd.DataFrame:
@@ -271,19 +535,8 @@ def get_one_hit_wonders(df: pd.DataFrame, limit: int = 50) -> pd.DataFrame:
     Get tracks that have only been played once ever.
     Filtered to: 2+ minutes played AND not on any playlist.
     """
-    # Get tracks on playlists
-    playlist_tracks = get_all_playlist_tracks()
-    if not playlist_tracks.empty:
-        playlist_set = set(zip(playlist_tracks["track"], playlist_tracks["artist"]))
-    else:
-        playlist_set = set()
-
     # Aggregate streaming data
-    track_counts = df.groupby(["track", "artist", "album"]).agg(
-        play_count=("ts", "count"),
-        played_on=("ts", "first"),
-        ms_played=("ms_played", "sum"),
-    ).reset_index()
+    track_counts = _track_totals(df, by_album=True).rename(columns={"last_played": "played_on"})
 
     # Filter: played exactly once, 2+ minutes, not on any playlist
     one_hits = track_counts[
@@ -292,36 +545,25 @@ def get_one_hit_wonders(df: pd.DataFrame, limit: int = 50) -> pd.DataFrame:
     ].copy()
 
     # Remove tracks that are on playlists
-    one_hits["on_playlist"] = one_hits.apply(
-        lambda row: (row["track"], row["artist"]) in playlist_set, axis=1
-    )
+    one_hits["on_playlist"] = get_playlist_track_mask(one_hits)
     one_hits = one_hits[~one_hits["on_playlist"]]
 
-    one_hits = one_hits.sort_values("played_on", ascending=False)
-    return one_hits.head(limit)
+    one_hits = one_hits.nlargest(limit, "played_on")
+
+    # Display string for the returned slice only, so callers never re-parse
+    one_hits["played_on_str"] = one_hits["played_on"].dt.strftime("%Y-%m-%d")
+    return one_hits
 
 
 def get_one_hit_wonder_stats(df: pd.DataFrame) -> dict:
     """Get overall stats about one-hit wonders (2+ min, not on playlist)."""
-    # Get tracks on playlists
-    playlist_tracks = get_all_playlist_tracks()
-    if not playlist_tracks.empty:
-        playlist_set = set(zip(playlist_tracks["track"], playlist_tracks["artist"]))
-    else:
-        playlist_set = set()
-
-    track_counts = df.groupby(["track", "artist"]).agg(
-        play_count=("ts", "count"),
-        ms_played=("ms_played", "sum"),
-    ).reset_index()
+    track_counts = _track_totals(df)
 
     # Filter to 2+ minutes
-    track_counts = track_counts[track_counts["ms_played"] >= 120000]
+    track_counts = track_counts[track_counts["ms_played"] >= 120000].copy()
 
     # Mark if on playlist
-    track_counts["on_playlist"] = track_counts.apply(
-        lambda row: (row["track"], row["artist"]) in playlist_set, axis=1
-    )
+    track_counts["on_playlist"] = get_playlist_track_mask(track_counts)
 
     # One-hits: played once AND not on playlist
     one_hits = track_counts[
@@ -341,26 +583,11 @@ def get_one_hit_wonder_stats(df: pd.DataFrame) -> dict:
 
 def get_not_on_playlist_stats(df: pd.DataFrame) -> dict:
     """Get stats about tracks played but not on any playlist."""
-    playlist_tracks = get_all_playlist_tracks()
-    if not playlist_tracks.empty:
-        # Use lowercase for case-insensitive matching
-        playlist_set = set(
-            (str(t).lower(), str(a).lower())
-            for t, a in zip(playlist_tracks["track"], playlist_tracks["artist"])
-        )
-    else:
-        playlist_set = set()
-
     # Aggregate streaming data
-    track_counts = df.groupby(["track", "artist"]).agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-    ).reset_index()
+    track_counts = _track_totals(df)
 
     # Mark if on playlist (case-insensitive)
-    track_counts["on_playlist"] = track_counts.apply(
-        lambda row: (str(row["track"]).lower(), str(row["artist"]).lower()) in playlist_set, axis=1
-    )
+    track_counts["on_playlist"] = get_playlist_track_mask(track_counts, case_sensitive=False)
 
     on_playlist = track_counts[track_counts["on_playlist"]]
     not_on_playlist = track_counts[~track_counts["on_playlist"]]
@@ -377,41 +604,24 @@ def get_not_on_playlist_stats(df: pd.DataFrame) -> dict:
 
 def get_top_not_on_playlist(df: pd.DataFrame, limit: int = 20) -> pd.DataFrame:
     """Get most played tracks that are NOT on any playlist."""
-    playlist_tracks = get_all_playlist_tracks()
-    if not playlist_tracks.empty:
-        # Use lowercase for case-insensitive matching
-        playlist_set = set(
-            (str(t).lower(), str(a).lower())
-            for t, a in zip(playlist_tracks["track"], playlist_tracks["artist"])
-        )
-    else:
-        playlist_set = set()
-
     # Aggregate streaming data
-    track_counts = df.groupby(["track", "artist", "album"]).agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-        last_played=("ts", "max"),
-    ).reset_index()
+    track_counts = _track_totals(df, by_album=True)
 
     # Filter to NOT on playlist (case-insensitive)
-    track_counts["on_playlist"] = track_counts.apply(
-        lambda row: (str(row["track"]).lower(), str(row["artist"]).lower()) in playlist_set, axis=1
-    )
+    track_counts["on_playlist"] = get_playlist_track_mask(track_counts, case_sensitive=False)
     not_on_playlist = track_counts[~track_counts["on_playlist"]].copy()
 
-    return not_on_playlist.sort_values("play_count", ascending=False).head(limit)
+    return not_on_playlist.nlargest(limit, "play_count")
 
 
 def get_most_skipped(df: pd.DataFrame, limit: int = 20) -> pd.DataFrame:
     """Get most skipped tracks."""
     skipped = df[df["skipped"] == True]
 
-    stats = skipped.groupby(["track", "artist"]).agg(
-        skip_count=("ts", "count"),
-    ).reset_index()
+    stats = _compute_track_totals(skipped)[["track", "artist", "play_count", "track_label"]]
+    stats = stats.rename(columns={"play_count": "skip_count"})
 
-    return stats.sort_values("skip_count", ascending=False).head(limit)
+    return stats.nlargest(limit, "skip_count")
 
 
 def get_listening_over_time(df: pd.DataFrame, period: str = "M") -> pd.DataFrame:
@@ -419,15 +629,16 @@ def get_listening_over_time(df: pd.DataFrame, period: str = "M") -> pd.DataFrame
     Get listening activity over time.
     period: 'D' for daily, 'W' for weekly, 'M' for monthly, 'Y' for yearly
     """
-    df_copy = df.copy()
-    df_copy["period"] = df_copy["ts"].dt.to_period(period)
-
-    stats = df_copy.groupby("period").agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-        unique_tracks=("track", "nunique"),
-        unique_artists=("artist", "nunique"),
-    ).reset_index()
+    periods = df["ts"].dt.to_period(period).rename("period")
+
+    stats = _ms_to_minutes(
+        df.groupby(periods, observed=True).agg(
+            play_count=("ts", "count"),
+            ms_played=("ms_played", "sum"),
+            unique_tracks=("track", "nunique"),
+            unique_artists=("artist", "nunique"),
+        ).reset_index()
+    )
 
     stats["period"] = stats["period"].astype(str)
     return stats
@@ -487,7 +698,8 @@ def get_all_playlist_tracks() -> pd.DataFrame:
     data = load_playlists()
     playlists = data.get("playlists", [])
 
-    tracks = []
+    # Accumulate columns directly rather than one dict per track
+    columns = {"playlist": [], "track": [], "artist": [], "album": [], "uri": []}
     for p in playlists:
         playlist_name = p.get("name", "Unknown")
         if playlist_name in EXCLUDED_PLAYLISTS:
@@ -495,15 +707,13 @@ def get_all_playlist_tracks() -> pd.DataFrame:
         for item in p.get("items", []):
             if item.get("track"):
                 track = item["track"]
-                tracks.append({
-                    "playlist": playlist_name,
-                    "track": track.get("trackName"),
-                    "artist": track.get("artistName"),
-                    "album": track.get("albumName"),
-                    "uri": track.get("trackUri"),
-                })
+                columns["playlist"].append(playlist_name)
+                columns["track"].append(track.get("trackName"))
+                columns["artist"].append(track.get("artistName"))
+                columns["album"].append(track.get("albumName"))
+                columns["uri"].append(track.get("trackUri"))
 
-    return pd.DataFrame(tracks)
+    return pd.DataFrame(columns)
 
 
 def get_playlist_top_artists(playlist_name: str, limit: int = 15) -> pd.DataFrame:
@@ -516,8 +726,8 @@ def get_playlist_top_artists(playlist_name: str, limit: int = 15) -> pd.DataFram
     if playlist_df.empty:
         return pd.DataFrame()
 
-    stats = playlist_df.groupby("artist").size().reset_index(name="track_count")
-    return stats.sort_values("track_count", ascending=False).head(limit)
+    stats = playlist_df.groupby("artist", observed=True).size().reset_index(name="track_count")
+    return stats.nlargest(limit, "track_count")
 
 
 def get_playlist_tracks(playlist_name: str) -> pd.DataFrame:
@@ -552,13 +762,13 @@ def get_artist_playlist_distribution(limit: int = 20) -> pd.DataFrame:
         return pd.DataFrame()
 
     # Count unique playlists per artist
-    artist_playlists = df.groupby("artist").agg(
+    artist_playlists = df.groupby("artist", observed=True).agg(
         playlist_count=("playlist", "nunique"),
         track_count=("track", "count"),
         playlists=("playlist", lambda x: list(x.unique())),
     ).reset_index()
 
-    return artist_playlists.sort_values("playlist_count", ascending=False).head(limit)
+    return artist_playlists.nlargest(limit, "playlist_count")
 
 
 def get_track_duplicates() -> pd.DataFrame:
@@ -568,7 +778,7 @@ def get_track_duplicates() -> pd.DataFrame:
         return pd.DataFrame()
 
     # Group by track + artist and count playlists
-    dupes = df.groupby(["track", "artist"]).agg(
+    dupes = df.groupby(["track", "artist"], observed=True).agg(
         playlist_count=("playlist", "nunique"),
         playlists=("playlist", lambda x: list(x.unique())),
     ).reset_index()
@@ -578,8 +788,13 @@ def get_track_duplicates() -> pd.DataFrame:
     return dupes.sort_values("playlist_count", ascending=False)
 
 
+@lru_cache(maxsize=64)
 def get_playlist_overlap(playlist1: str, playlist2: str) -> dict:
-    """Compare two playlists and find overlapping artists/tracks."""
+    """
+    Compare two playlists and find overlapping artists/tracks.
+    shared_tracks is a dict of parallel "track" and "artist" lists, ready
+    for pd.DataFrame. Results are cached, so treat them as read-only.
+    """
     df = get_all_playlist_tracks()
     if df.empty:
         return {}
@@ -594,6 +809,7 @@ def get_playlist_overlap(playlist1: str, playlist2: str) -> dict:
     p1_tracks = set(zip(p1["track"], p1["artist"]))
     p2_tracks = set(zip(p2["track"], p2["artist"]))
     shared_tracks = p1_tracks & p2_tracks
+    shared_track_names, shared_track_artists = map(list, zip(*shared_tracks)) if shared_tracks else ([], [])
 
     return {
         "playlist1": playlist1,
@@ -604,7 +820,7 @@ def get_playlist_overlap(playlist1: str, playlist2: str) -> dict:
         "p2_artist_count": len(p2_artists),
         "shared_artists": list(shared_artists),
         "shared_artist_count": len(shared_artists),
-        "shared_tracks": [{"track": t, "artist": a} for t, a in shared_tracks],
+        "shared_tracks": {"track": shared_track_names, "artist": shared_track_artists},
         "shared_track_count": len(shared_tracks),
     }
 
@@ -621,29 +837,20 @@ def get_playlist_track_overlaps(playlist_name: str) -> pd.DataFrame:
     if playlist_tracks.empty:
         return pd.DataFrame()
 
-    # Find which of these tracks appear in OTHER playlists
-    results = []
-    for _, row in playlist_tracks.iterrows():
-        track, artist = row["track"], row["artist"]
-        # Find all playlists containing this track (excluding the current one)
-        other_playlists = df[
-            (df["track"] == track) &
-            (df["artist"] == artist) &
-            (df["playlist"] != playlist_name)
-        ]["playlist"].unique().tolist()
-
-        if other_playlists:
-            results.append({
-                "track": track,
-                "artist": artist,
-                "other_playlists": other_playlists,
-                "overlap_count": len(other_playlists),
-            })
+    # Playlists each track appears in besides this one, from one groupby
+    others = df[df["playlist"] != playlist_name]
+    other_playlists = (
+        others.groupby(["track", "artist"], observed=True, sort=False)["playlist"]
+        .unique()
+        .map(list)
+        .rename("other_playlists")
+        .reset_index()
+    )
 
-    result_df = pd.DataFrame(results)
-    if not result_df.empty:
-        result_df = result_df.sort_values("overlap_count", ascending=False)
-    return result_df
+    results = playlist_tracks.merge(other_playlists, on=["track", "artist"])
+    results["overlap_count"] = results["other_playlists"].str.len()
+
+    return results.sort_values("overlap_count", ascending=False)
 
 
 def get_overall_playlist_summary() -> dict:
@@ -654,10 +861,16 @@ def get_overall_playlist_summary() -> dict:
     if df.empty:
         return {}
 
+    # Count distinct (track, artist) pairs as distinct combined integer
+    # codes; shifting by one keeps missing names (code -1) as their own value
+    track_codes, _ = pd.factorize(df["track"])
+    artist_codes, artists = pd.factorize(df["artist"])
+    pair_ids = (track_codes.astype(np.int64) + 1) * (len(artists) + 1) + (artist_codes + 1)
+
     return {
         "total_playlists": len(stats),
         "total_tracks": len(df),
-        "unique_tracks": df.drop_duplicates(subset=["track", "artist"]).shape[0],
+        "unique_tracks": len(np.unique(pair_ids)),
         "unique_artists": df["artist"].nunique(),
         "avg_playlist_size": round(stats["track_count"].mean(), 1) if not stats.empty else 0,
         "largest_playlist": stats.iloc[0]["name"] if not stats.empty else "",
@@ -693,10 +906,12 @@ def get_top_genres(df: pd.DataFrame, limit: int = 20) -> pd.DataFrame:
         return pd.DataFrame()
 
     # Count plays per artist
-    artist_plays = df.groupby("artist").agg(
-        play_count=("ts", "count"),
-        total_minutes=("minutes_played", "sum"),
-    ).reset_index()
+    artist_plays = _ms_to_minutes(
+        df.groupby("artist", observed=True).agg(
+            play_count=("ts", "count"),
+            ms_played=("ms_played", "sum"),
+        ).reset_index()
+    )
 
     # Expand genres (each artist can have multiple)
     genre_plays = []
@@ -714,12 +929,12 @@ def get_top_genres(df: pd.DataFrame, limit: int = 20) -> pd.DataFrame:
         return pd.DataFrame()
 
     genre_df = pd.DataFrame(genre_plays)
-    stats = genre_df.groupby("genre").agg(
+    stats = genre_df.groupby("genre", observed=True).agg(
         play_count=("play_count", "sum"),
         total_minutes=("total_minutes", "sum"),
     ).reset_index()
 
-    return stats.sort_values("play_count", ascending=False).head(limit)
+    return stats.nlargest(limit, "play_count")
 
 
 def get_genre_trends(df: pd.DataFrame, top_n: int = 5) -> pd.DataFrame:
@@ -759,7 +974,7 @@ def get_genre_trends(df: pd.DataFrame, top_n: int = 5) -> pd.DataFrame:
         return pd.DataFrame()
 
     result_df = pd.DataFrame(results)
-    stats = result_df.groupby(["period", "genre"]).agg(
+    stats = result_df.groupby(["period", "genre"], observed=True).agg(
         play_count=("play_count", "sum"),
     ).reset_index()
 
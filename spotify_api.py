@@ -10,96 +10,233 @@ The module gracefully handles missing credentials and caches results locally.
 """
 
 import json
+import logging
 import os
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable
 from datetime import datetime, timedelta
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 # File paths
 CACHE_DIR = Path(__file__).parent / ".cache"
 GENRE_CACHE_FILE = CACHE_DIR / "artist_genres.json"
 TOKEN_CACHE_FILE = CACHE_DIR / "spotify_token.json"
+TRACK_ARTISTS_CACHE_FILE = CACHE_DIR / "track_artists.json"
 
 # API endpoints
 SPOTIFY_TOKEN_URL = "https://accounts.spotify.com/api/token"
 SPOTIFY_API_BASE = "https://api.spotify.com/v1"
 
+USER_AGENT = "spotifydata/1.0"
+
+TRACK_URI_PREFIX = "spotify:track:"
+_TRACK_PREFIX_LEN = len(TRACK_URI_PREFIX)
+
+# IDs per request (the API maximum) and concurrent batch requests
+BATCH_SIZE = 50
+MAX_WORKERS = 8
+
+_session = None
+
+# Serializes cache file reads and writes across threads
+_cache_lock = threading.Lock()
+
+# Credentials, read once at import (see _refresh_credentials)
+_CLIENT_ID: str | None = None
+_CLIENT_SECRET: str | None = None
+_API_AVAILABLE = False
+
+# Access token and its expiry (buffer included), so the token file is only
+# read on a cold start
+_token_cache: tuple[str, datetime] | None = None
+
+# Number of artists in the genre cache as of the last load/save, so status
+# checks don't decode the whole file
+_artist_count: int | None = None
+
+
+def get_session() -> "requests.Session":
+    """
+    Shared HTTP session for all Spotify calls, created on first use.
+    Reusing it keeps connections to the token and API hosts alive instead
+    of paying a TCP + TLS handshake per request. Rate limiting (honouring
+    Retry-After), 5xx responses and connection errors are retried with
+    capped exponential backoff.
+    """
+    global _session
+    if _session is None:
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_max=30,
+            backoff_jitter=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=20, max_retries=retry))
+        session.headers.update({"User-Agent": USER_AGENT})
+        _session = session
+    return _session
+
+
+def _refresh_credentials():
+    """Re-read the API credentials from the environment."""
+    global _CLIENT_ID, _CLIENT_SECRET, _API_AVAILABLE
+    _CLIENT_ID = os.environ.get("SPOTIFY_CLIENT_ID")
+    _CLIENT_SECRET = os.environ.get("SPOTIFY_CLIENT_SECRET")
+    _API_AVAILABLE = REQUESTS_AVAILABLE and bool(_CLIENT_ID and _CLIENT_SECRET)
+
+
+_refresh_credentials()
+
 
 def is_api_available() -> bool:
     """Check if Spotify API credentials are configured."""
-    if not REQUESTS_AVAILABLE:
-        return False
-    client_id = os.environ.get("SPOTIFY_CLIENT_ID")
-    client_secret = os.environ.get("SPOTIFY_CLIENT_SECRET")
-    return bool(client_id and client_secret)
+    return _API_AVAILABLE
 
 
 def get_api_status() -> dict:
     """Get current API configuration status."""
     return {
         "requests_installed": REQUESTS_AVAILABLE,
-        "credentials_configured": is_api_available(),
-        "client_id_set": bool(os.environ.get("SPOTIFY_CLIENT_ID")),
-        "client_secret_set": bool(os.environ.get("SPOTIFY_CLIENT_SECRET")),
+        "credentials_configured": _API_AVAILABLE,
+        "client_id_set": bool(_CLIENT_ID),
+        "client_secret_set": bool(_CLIENT_SECRET),
         "cache_exists": GENRE_CACHE_FILE.exists(),
-        "cached_artists": len(load_genre_cache()) if GENRE_CACHE_FILE.exists() else 0,
+        "cached_artists": _cached_artist_count(),
     }
 
 
+def _cached_artist_count() -> int:
+    """Artists in the genre cache, loading it only if not yet counted."""
+    if _artist_count is not None:
+        return _artist_count
+    return len(load_genre_cache()) if GENRE_CACHE_FILE.exists() else 0
+
+
 def _ensure_cache_dir():
     """Ensure cache directory exists."""
     CACHE_DIR.mkdir(exist_ok=True)
 
 
+def _loads(data: bytes):
+    """Decode JSON bytes, with orjson if installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data, pretty: bool = False) -> bytes:
+    """Encode JSON to UTF-8 bytes, with orjson if installed; compact unless pretty."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _write_json_atomic(path: Path, data, pretty: bool = False):
+    """
+    Write JSON to a temp file and rename it over path, so a crash mid-write
+    never leaves a truncated cache behind. Holds _cache_lock so concurrent
+    writers don't share the temp file.
+    """
+    payload = _dumps(data, pretty=pretty)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with _cache_lock:
+        _ensure_cache_dir()
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a cache file under _cache_lock."""
+    with _cache_lock:
+        with open(path, "rb") as f:
+            return f.read()
+
+
 def load_genre_cache() -> dict[str, list[str]]:
     """Load cached artist genres from disk."""
+    global _artist_count
     if not GENRE_CACHE_FILE.exists():
         return {}
     try:
-        with open(GENRE_CACHE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        cache = _loads(_read_bytes(GENRE_CACHE_FILE))
+        _artist_count = len(cache)
+        return cache
+    except (json.JSONDecodeError, IOError):
+        return {}
+
+
+def save_genre_cache(cache: dict[str, list[str]], pretty: bool = False):
+    """Save artist genres cache to disk (indented if pretty, for inspection)."""
+    global _artist_count
+    _write_json_atomic(GENRE_CACHE_FILE, cache, pretty=pretty)
+    _artist_count = len(cache)
+
+
+def load_track_cache() -> dict[str, list[dict]]:
+    """Load cached track_id -> [{id, name}, ...] artist mappings from disk."""
+    if not TRACK_ARTISTS_CACHE_FILE.exists():
+        return {}
+    try:
+        return _loads(_read_bytes(TRACK_ARTISTS_CACHE_FILE))
     except (json.JSONDecodeError, IOError):
         return {}
 
 
-def save_genre_cache(cache: dict[str, list[str]]):
-    """Save artist genres cache to disk."""
-    _ensure_cache_dir()
-    with open(GENRE_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2)
+def save_track_cache(cache: dict[str, list[dict]], pretty: bool = False):
+    """Save track artists cache to disk (indented if pretty, for inspection)."""
+    _write_json_atomic(TRACK_ARTISTS_CACHE_FILE, cache, pretty=pretty)
 
 
 def _load_token_cache() -> dict | None:
-    """Load cached access token."""
+    """Load cached access token from disk, keeping it in memory too."""
+    global _token_cache
     if not TOKEN_CACHE_FILE.exists():
         return None
     try:
-        with open(TOKEN_CACHE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            # Check if token is expired
-            expires_at = datetime.fromisoformat(data.get("expires_at", "2000-01-01"))
-            if datetime.now() < expires_at:
-                return data
-    except (json.JSONDecodeError, IOError, ValueError):
+        data = _loads(_read_bytes(TOKEN_CACHE_FILE))
+        # Check if token is expired
+        expires_at = datetime.fromisoformat(data.get("expires_at", "2000-01-01"))
+        if datetime.now() < expires_at:
+            _token_cache = (data["access_token"], expires_at)
+            return data
+    except (json.JSONDecodeError, IOError, ValueError, KeyError):
         pass
     return None
 
 
 def _save_token_cache(token: str, expires_in: int):
-    """Save access token to cache."""
-    _ensure_cache_dir()
+    """Save access token to the in-memory and on-disk caches."""
+    global _token_cache
     expires_at = datetime.now() + timedelta(seconds=expires_in - 60)  # 1 min buffer
-    with open(TOKEN_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump({
-            "access_token": token,
-            "expires_at": expires_at.isoformat(),
-        }, f)
+    _token_cache = (token, expires_at)
+    _write_json_atomic(TOKEN_CACHE_FILE, {
+        "access_token": token,
+        "expires_at": expires_at.isoformat(),
+    })
 
 
 def get_access_token() -> str | None:
@@ -110,20 +247,24 @@ def get_access_token() -> str | None:
     if not is_api_available():
         return None
 
-    # Check cache first
+    # Check the in-memory cache, then the token file
+    if _token_cache and datetime.now() < _token_cache[1]:
+        return _token_cache[0]
+
     cached = _load_token_cache()
     if cached:
         return cached["access_token"]
 
     # Request new token
     try:
-        response = requests.post(
+        response = get_session().post(
             SPOTIFY_TOKEN_URL,
             data={
                 "grant_type": "client_credentials",
-                "client_id": os.environ["SPOTIFY_CLIENT_ID"],
-                "client_secret": os.environ["SPOTIFY_CLIENT_SECRET"],
+                "client_id": _CLIENT_ID,
+                "client_secret": _CLIENT_SECRET,
             },
+            headers={"Authorization": None},  # Drop any session-level bearer token
             timeout=10,
         )
         response.raise_for_status()
@@ -133,64 +274,90 @@ def get_access_token() -> str | None:
         _save_token_cache(token, expires_in)
         return token
     except Exception as e:
-        print(f"Failed to get Spotify access token: {e}")
+        logger.warning("Failed to get Spotify access token: %s", e)
         return None
 
 
-def fetch_artists_genres(artist_ids: list[str], token: str) -> dict[str, list[str]]:
+def _do_batch(session: "requests.Session", url: str, batch: list[str]) -> dict:
+    """
+    GET one batch of IDs from an API endpoint URL. Retries happen in the
+    session's adapter. Returns the decoded JSON response, parsed from the
+    raw body (with orjson when available).
+    """
+    response = session.get(
+        url,
+        params={"ids": ",".join(batch)},
+        timeout=10,
+    )
+    response.raise_for_status()
+    return _loads(response.content)
+
+
+def _fetch_batches(
+    endpoint: str,
+    unique_ids: list[str],
+    parse,
+    on_batch: Callable[[dict], None] | None = None,
+) -> dict:
+    """
+    Fetch IDs in batches of BATCH_SIZE on a thread pool sharing the session.
+    parse turns one decoded response into a partial result dict; partials
+    are merged as batches complete and passed to on_batch, if given, on the
+    calling thread. Failed batches are reported and skipped; on_batch errors
+    are reported separately and don't drop the batch from the result.
+    """
+    results = {}
+    session = get_session()
+    url = f"{SPOTIFY_API_BASE}/{endpoint}"
+    batches = [unique_ids[i:i + BATCH_SIZE] for i in range(0, len(unique_ids), BATCH_SIZE)]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(_do_batch, session, url, batch) for batch in batches]
+        for future in as_completed(futures):
+            try:
+                partial = parse(future.result())
+            except Exception as e:
+                logger.warning("Error fetching %s batch: %s", endpoint, e)
+                continue
+            results.update(partial)
+            if on_batch is not None:
+                try:
+                    on_batch(partial)
+                except Exception as e:
+                    logger.warning("Error handling fetched %s batch: %s", endpoint, e)
+
+    return results
+
+
+def fetch_artists_genres(
+    artist_ids: list[str],
+    token: str,
+    on_batch: Callable[[dict[str, list[str]]], None] | None = None,
+) -> dict[str, list[str]]:
     """
     Fetch genres for multiple artists from Spotify API.
-    Batches requests (max 50 per call) and handles rate limiting.
+    Batches requests (max 50 per call) and fetches batches concurrently;
+    rate limiting is handled by the session's retry policy. on_batch is
+    called with each batch's artist_id -> genres as it completes.
 
     Returns dict mapping artist_id -> list of genres.
     """
     if not artist_ids or not token:
         return {}
 
-    results = {}
-    # Deduplicate and filter empty IDs
-    unique_ids = list(set(aid for aid in artist_ids if aid))
-
-    # Batch in chunks of 50
-    for i in range(0, len(unique_ids), 50):
-        batch = unique_ids[i:i + 50]
-
-        try:
-            response = requests.get(
-                f"{SPOTIFY_API_BASE}/artists",
-                params={"ids": ",".join(batch)},
-                headers={"Authorization": f"Bearer {token}"},
-                timeout=10,
-            )
-
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 5))
-                print(f"Rate limited. Waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                # Retry this batch
-                response = requests.get(
-                    f"{SPOTIFY_API_BASE}/artists",
-                    params={"ids": ",".join(batch)},
-                    headers={"Authorization": f"Bearer {token}"},
-                    timeout=10,
-                )
-
-            response.raise_for_status()
-
-            for artist in response.json().get("artists", []):
-                if artist:
-                    results[artist["id"]] = artist.get("genres", [])
-
-        except Exception as e:
-            print(f"Error fetching artist batch: {e}")
-            continue
-
-        # Small delay between batches to be nice to the API
-        if i + 50 < len(unique_ids):
-            time.sleep(0.1)
+    get_session().headers["Authorization"] = f"Bearer {token}"
 
-    return results
+    # Deduplicate and filter empty IDs, keeping first-seen order
+    unique_ids = list(dict.fromkeys(aid for aid in artist_ids if aid))
+
+    def parse(payload: dict) -> dict[str, list[str]]:
+        return {
+            artist["id"]: artist.get("genres") or []
+            for artist in payload["artists"]
+            if artist
+        }
+
+    return _fetch_batches("artists", unique_ids, parse, on_batch)
 
 
 def fetch_track_artists(track_ids: list[str], token: str) -> dict[str, list[dict]]:
@@ -201,57 +368,26 @@ def fetch_track_artists(track_ids: list[str], token: str) -> dict[str, list[dict
     if not track_ids or not token:
         return {}
 
-    results = {}
-    unique_ids = list(set(tid for tid in track_ids if tid))
-
-    # Batch in chunks of 50
-    for i in range(0, len(unique_ids), 50):
-        batch = unique_ids[i:i + 50]
-
-        try:
-            response = requests.get(
-                f"{SPOTIFY_API_BASE}/tracks",
-                params={"ids": ",".join(batch)},
-                headers={"Authorization": f"Bearer {token}"},
-                timeout=10,
-            )
-
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 5))
-                time.sleep(retry_after)
-                response = requests.get(
-                    f"{SPOTIFY_API_BASE}/tracks",
-                    params={"ids": ",".join(batch)},
-                    headers={"Authorization": f"Bearer {token}"},
-                    timeout=10,
-                )
-
-            response.raise_for_status()
-
-            for track in response.json().get("tracks", []):
-                if track:
-                    artists = [
-                        {"id": a["id"], "name": a["name"]}
-                        for a in track.get("artists", [])
-                    ]
-                    results[track["id"]] = artists
-
-        except Exception as e:
-            print(f"Error fetching track batch: {e}")
-            continue
-
-        if i + 50 < len(unique_ids):
-            time.sleep(0.1)
+    get_session().headers["Authorization"] = f"Bearer {token}"
 
-    return results
+    unique_ids = list(dict.fromkeys(tid for tid in track_ids if tid))
+
+    def parse(payload: dict) -> dict[str, list[dict]]:
+        return {
+            track["id"]: [{"id": a["id"], "name": a["name"]} for a in track["artists"]]
+            for track in payload["tracks"]
+            if track
+        }
+
+    return _fetch_batches("tracks", unique_ids, parse)
 
 
 def extract_track_id(uri: str) -> str | None:
     """Extract track ID from Spotify URI like 'spotify:track:3ibKnFDaa3GhpPGlOUj7ff'."""
     if not uri or not isinstance(uri, str):
         return None
-    if uri.startswith("spotify:track:"):
-        return uri.split(":")[-1]
+    if uri.startswith(TRACK_URI_PREFIX):
+        return uri[_TRACK_PREFIX_LEN:]
     return None
 
 
@@ -263,7 +399,9 @@ def enrich_with_genres(
     """
     Main function to get genres for artists.
 
-    Uses cache when available, fetches from API when needed.
+    Uses cache when available, fetches from API when needed: artists from
+    streaming_df that are not cached yet are looked up and added. With
+    force_refresh, every artist is refetched regardless of the cache.
     Returns dict mapping artist_name -> list of genres.
 
     If API is not available, returns cached data only.
@@ -271,57 +409,82 @@ def enrich_with_genres(
     # Load existing cache
     cache = load_genre_cache()
 
-    # If we have cached data and not forcing refresh, use it
-    if cache and not force_refresh:
-        # Map by artist name (cache stores by ID, but we can also store by name)
+    # Without streaming data there are no tracks to resolve artists from
+    if streaming_df is None:
         return cache
 
     # Check if API is available
     if not is_api_available():
-        print("Spotify API not configured. Using cached data only.")
+        logger.info("Spotify API not configured. Using cached data only.")
         return cache
 
     token = get_access_token()
     if not token:
-        print("Could not get Spotify access token. Using cached data only.")
+        logger.warning("Could not get Spotify access token. Using cached data only.")
         return cache
 
-    # If we have streaming data, extract track IDs to find artist IDs
-    if streaming_df is not None:
-        # Get unique track URIs
-        track_uris = streaming_df["spotify_track_uri"].dropna().unique()
-        track_ids = [extract_track_id(uri) for uri in track_uris]
-        track_ids = [tid for tid in track_ids if tid]
-
-        # Fetch artist info for tracks
-        print(f"Fetching artist info for {len(track_ids)} tracks...")
-        track_artists = fetch_track_artists(track_ids[:1000], token)  # Limit for now
-
-        # Collect unique artist IDs
-        artist_ids = set()
-        artist_id_to_name = {}
-        for artists in track_artists.values():
-            for artist in artists:
-                artist_ids.add(artist["id"])
-                artist_id_to_name[artist["id"]] = artist["name"]
-
-        # Fetch genres for artists
-        print(f"Fetching genres for {len(artist_ids)} artists...")
-        artist_genres = fetch_artists_genres(list(artist_ids), token)
-
-        # Build result mapping artist name -> genres
+    # Get unique track URIs; their track IDs lead to the artist IDs
+    track_uris = streaming_df["spotify_track_uri"].dropna().unique()
+    # One pass, same rules as extract_track_id (empty IDs dropped)
+    track_ids = [
+        uri[_TRACK_PREFIX_LEN:]
+        for uri in track_uris
+        if isinstance(uri, str) and uri.startswith(TRACK_URI_PREFIX) and len(uri) > _TRACK_PREFIX_LEN
+    ]
+
+    # Unless refreshing, only fetch artist info for tracks not resolved on a
+    # previous run (the cache is still loaded so a refresh merges into it)
+    track_cache = load_track_cache()
+    known = {} if force_refresh else track_cache
+    track_artists = {tid: known[tid] for tid in track_ids if tid in known}
+    missing_tracks = [tid for tid in track_ids if tid not in known]
+
+    logger.info(
+        "Fetching artist info for %d tracks (%d already cached)...",
+        min(len(missing_tracks), 1000), len(track_artists),
+    )
+    fetched = fetch_track_artists(missing_tracks[:1000], token)  # Limit for now
+    if fetched:
+        track_artists.update(fetched)
+        track_cache.update(fetched)
+        save_track_cache(track_cache)
+
+    # Collect unique artist IDs in first-seen order (dict keys), walking the
+    # tracks in input order: track_artists is keyed in whatever order the
+    # /tracks batches completed, so batches built from it would vary by run
+    artist_id_to_name = {}
+    for tid in track_ids:
+        for artist in track_artists.get(tid, ()):
+            artist_id_to_name[artist["id"]] = artist["name"]
+
+    # Unless refreshing, only fetch genres for artists not already cached (by name)
+    if force_refresh:
+        missing_ids = list(artist_id_to_name)
+    else:
+        missing_ids = [aid for aid, name in artist_id_to_name.items() if name not in cache]
+
+    logger.info(
+        "Fetching genres for %d artists (%d already cached)...",
+        len(missing_ids), len(artist_id_to_name) - len(missing_ids),
+    )
+
+    # Checkpoint the cache (by artist name) after every batch, so an
+    # interrupted run resumes without refetching completed batches
+    cached_count = 0
+
+    def checkpoint(partial: dict[str, list[str]]):
+        nonlocal cached_count
         result = {}
-        for artist_id, genres in artist_genres.items():
+        for artist_id, genres in partial.items():
             name = artist_id_to_name.get(artist_id)
             if name:
                 result[name] = genres
-
-        # Update and save cache
         cache.update(result)
         save_genre_cache(cache)
-        print(f"Cached genres for {len(result)} artists.")
+        cached_count += len(result)
 
-        return cache
+    fetch_artists_genres(missing_ids, token, on_batch=checkpoint)
+    logger.info("Cached genres for %d artists.", cached_count)
 
     return cache
 